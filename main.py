@@ -1,8 +1,6 @@
 import streamlit as st
 import pandas as pd
-import plotly.express as px
 import numpy as np
-import statsmodels.api as sm
 
 # Set page configuration for a professional look
 st.set_page_config(page_title="Purdue Engineering Employment Report", layout="wide")
@@ -22,12 +20,6 @@ causal analysis that examines the relationship between technical skill proficien
 # 1. Expanded Companies Dataset
 companies = ["Google", "Microsoft", "Boeing", "General Electric", "Apple", "Lockheed Martin", 
              "Northrop Grumman", "Amazon", "IBM", "Intel"]
-np.random.seed(42)
-graduates = np.random.randint(50, 200, size=len(companies))
-companies_data = pd.DataFrame({
-    "Company": companies,
-    "Graduates": graduates
-})
 
 # 2. Expanded Skillsets by Job Title
 job_titles = {
@@ -38,13 +30,6 @@ job_titles = {
     "Mechanical Engineer": ["CAD", "Thermal Systems", "Materials", "Finite Element Analysis", "Dynamics"]
 }
 
-skillset_records = []
-for job, skills in job_titles.items():
-    for skill in skills:
-        frequency = np.random.randint(40, 150)
-        skillset_records.append({"Job Title": job, "Skill": skill, "Frequency": frequency})
-skillset_data = pd.DataFrame(skillset_records)
-
 # 3. Expanded Majors Distribution by Job Title
 majors_options = {
     "Software Engineer": ["Computer Engineering", "Software Engineering", "Electrical Engineering"],
@@ -54,93 +39,260 @@ majors_options = {
     "Mechanical Engineer": ["Mechanical Engineering", "Aerospace Engineering", "Industrial Engineering"]
 }
 
-majors_records = []
-for job, majors in majors_options.items():
-    for major in majors:
-        count = np.random.randint(20, 100)
-        majors_records.append({"Job Title": job, "Major": major, "Count": count})
-majors_data = pd.DataFrame(majors_records)
+# Data is generated once and memoized across Streamlit reruns.
+# The seed is an argument so the cache key fully determines the output.
+# Repeated labels are stored as categoricals rather than object strings, and
+# numeric columns use the narrowest dtype that holds their range.
+@st.cache_data
+def build_companies_df(seed=42):
+    rng = np.random.default_rng(seed)
+    graduates = rng.integers(50, 200, size=len(companies), dtype=np.int16)
+    return pd.DataFrame({
+        "Company": pd.Categorical(companies, categories=companies),
+        "Graduates": graduates
+    })
+
+@st.cache_data
+def build_skillset_df(seed=42):
+    rng = np.random.default_rng(seed)
+    jobs = np.repeat(list(job_titles), [len(v) for v in job_titles.values()])
+    skills = np.concatenate([list(v) for v in job_titles.values()])
+    frequencies = rng.integers(40, 150, size=len(skills), dtype=np.int16)
+    return pd.DataFrame({
+        "Job Title": pd.Categorical(jobs, categories=list(job_titles)),
+        "Skill": pd.Categorical(skills),
+        "Frequency": frequencies
+    })
+
+@st.cache_data
+def build_majors_df(seed=42):
+    rng = np.random.default_rng(seed)
+    jobs = np.repeat(list(majors_options), [len(v) for v in majors_options.values()])
+    majors = np.concatenate([list(v) for v in majors_options.values()])
+    counts = rng.integers(20, 100, size=len(majors), dtype=np.int16)
+    return pd.DataFrame({
+        "Job Title": pd.Categorical(jobs, categories=list(majors_options)),
+        "Major": pd.Categorical(majors),
+        "Count": counts
+    })
+
+companies_data = build_companies_df()
+skillset_data = build_skillset_df()
+majors_data = build_majors_df()
 
 # -------------------------------
 # Visualizations
 # -------------------------------
+# Each section is a fragment, so interacting with one reruns only that section.
+
+# Figures are cached as shared resources so reruns reuse the built Figure objects.
+# DataFrames are hashed by content with pandas' vectorized row hasher.
+def hash_dataframe(df):
+    return pd.util.hash_pandas_object(df, index=True).values.tobytes()
+
+df_hash_funcs = {pd.DataFrame: hash_dataframe}
+
+# Fixed figure size; disabling autosize avoids a client-side relayout on mount and resize
+fig_layout = dict(width=900, height=450, autosize=False)
 
 # Companies Bar Chart
-st.header("1. Companies Actively Recruiting Purdue Engineering Graduates")
-fig_companies = px.bar(companies_data, x="Company", y="Graduates", 
-                         title="Number of Purdue Engineering Graduates by Company",
-                         labels={"Graduates": "Number of Graduates"},
-                         text="Graduates")
-fig_companies.update_traces(texttemplate='%{text}', textposition='outside')
-st.plotly_chart(fig_companies, use_container_width=True)
+@st.cache_resource(hash_funcs=df_hash_funcs)
+def make_companies_fig(df):
+    import plotly.express as px
+
+    fig = px.bar(df, x="Company", y="Graduates", 
+                 title="Number of Purdue Engineering Graduates by Company",
+                 labels={"Graduates": "Number of Graduates"})
+    # Show counts on hover rather than as per-bar text labels
+    fig.update_traces(hovertemplate="%{x}: %{y} graduates<extra></extra>")
+    fig.update_layout(**fig_layout)
+    return fig
+
+@st.fragment
+def section_companies():
+    st.header("1. Companies Actively Recruiting Purdue Engineering Graduates")
+    fig_companies = make_companies_fig(companies_data)
+    st.plotly_chart(fig_companies, theme=None, use_container_width=False)
+
+section_companies()
 
 # Skillsets by Job Title
-st.header("2. Desired Skillsets by Job Title")
-fig_skills = px.bar(skillset_data, x="Job Title", y="Frequency", color="Skill", barmode="group",
-                    title="Desired Skillsets by Job Title",
-                    labels={"Frequency": "Skill Frequency"})
-st.plotly_chart(fig_skills, use_container_width=True)
+@st.cache_resource(hash_funcs=df_hash_funcs)
+def make_skills_fig(df):
+    import plotly.express as px
+
+    fig = px.bar(df, x="Job Title", y="Frequency", color="Skill", barmode="group",
+                 title="Desired Skillsets by Job Title",
+                 labels={"Frequency": "Skill Frequency"})
+    fig.update_layout(**fig_layout)
+    return fig
+
+@st.fragment
+def section_skills():
+    st.header("2. Desired Skillsets by Job Title")
+    fig_skills = make_skills_fig(skillset_data)
+    st.plotly_chart(fig_skills, theme=None, use_container_width=False)
+
+section_skills()
 
 # Majors Distribution (Sunburst Chart)
-st.header("3. Majors Hired for Different Job Titles")
-fig_majors = px.sunburst(majors_data, path=["Job Title", "Major"], values="Count",
-                         title="Distribution of Majors by Job Title")
-st.plotly_chart(fig_majors, use_container_width=True)
+@st.cache_resource(hash_funcs=df_hash_funcs)
+def make_majors_fig(df):
+    import plotly.graph_objects as go
+
+    # Build the two-level hierarchy directly: one root per job title, whose value is
+    # the sum of its majors, then one leaf per (job title, major) row
+    jobs = list(df["Job Title"].cat.categories)
+    job_totals = np.bincount(df["Job Title"].cat.codes.to_numpy(),
+                             weights=df["Count"].to_numpy(), minlength=len(jobs))
+    row_jobs = df["Job Title"].astype(str).tolist()
+    row_majors = df["Major"].astype(str).tolist()
+    ids = jobs + [f"{job}/{major}" for job, major in zip(row_jobs, row_majors)]
+    labels = jobs + row_majors
+    parents = [""] * len(jobs) + row_jobs
+    values = job_totals.tolist() + df["Count"].tolist()
+    fig = go.Figure(go.Sunburst(ids=ids, labels=labels, parents=parents, values=values,
+                                branchvalues="total"))
+    fig.update_layout(title="Distribution of Majors by Job Title")
+    fig.update_layout(**fig_layout)
+    return fig
+
+@st.fragment
+def section_majors():
+    st.header("3. Majors Hired for Different Job Titles")
+    fig_majors = make_majors_fig(majors_data)
+    st.plotly_chart(fig_majors, theme=None, use_container_width=False)
+
+section_majors()
 
 # Additional Analysis: Skill Frequency Heatmap
-st.header("4. Skill Frequency Heatmap")
-heatmap_data = skillset_data.pivot(index="Skill", columns="Job Title", values="Frequency").fillna(0)
-fig_heatmap = px.imshow(heatmap_data, 
-                        title="Heatmap of Skill Frequencies by Job Title",
-                        labels=dict(x="Job Title", y="Skill", color="Frequency"),
-                        aspect="auto")
-st.plotly_chart(fig_heatmap, use_container_width=True)
+@st.cache_resource(hash_funcs=df_hash_funcs)
+def make_heatmap_fig(df):
+    import plotly.express as px
+
+    # Scatter frequencies straight into a (skill x job) matrix using the category
+    # codes as row/column indices; missing pairs stay 0
+    jobs = list(df["Job Title"].cat.categories)
+    skills = list(df["Skill"].cat.categories)
+    heatmap_data = np.zeros((len(skills), len(jobs)))
+    np.add.at(heatmap_data,
+              (df["Skill"].cat.codes.to_numpy(), df["Job Title"].cat.codes.to_numpy()),
+              df["Frequency"].to_numpy())
+    fig = px.imshow(heatmap_data, x=jobs, y=skills,
+                    title="Heatmap of Skill Frequencies by Job Title",
+                    labels=dict(x="Job Title", y="Skill", color="Frequency"),
+                    aspect="auto")
+    fig.update_layout(**fig_layout)
+    return fig
+
+@st.fragment
+def section_heatmap():
+    st.header("4. Skill Frequency Heatmap")
+    fig_heatmap = make_heatmap_fig(skillset_data)
+    st.plotly_chart(fig_heatmap, theme=None, use_container_width=False)
+
+section_heatmap()
 
 # -------------------------------
 # Statistical Causal Analysis
 # -------------------------------
-st.header("5. Statistical Analysis: Linking Technical Skill Proficiency to Graduate Recruitment")
+# Create synthetic data for statistical analysis
+@st.cache_data
+def build_causal_df(seed=42, n_obs=50):
+    rng = np.random.default_rng(seed)
+    skill_score = rng.uniform(20, 100, size=n_obs)  # Simulated overall technical skill score
+    # Assume a linear relationship: Graduates = 50 + 3 * Skill_Score + noise
+    graduates_synthetic = 50 + 3 * skill_score + rng.normal(0, 15, size=n_obs)
+    return pd.DataFrame({
+        "Skill_Score": skill_score.astype(np.float32),
+        "Graduates": graduates_synthetic.astype(np.float32)
+    })
 
-st.markdown("""
-We simulate a synthetic scenario where an overall **Technical Skill Score** (aggregating high-demand skills)
-may influence the number of graduates recruited. In this synthetic dataset, we assume:
-- Higher technical skill scores are associated with increased recruitment.
-- We model the relationship using a linear regression.
-""")
+# Fit a simple linear regression in closed form: a single predictor does not
+# need a full statsmodels fit, only the slope, intercept and their statistics
+@st.cache_data
+def fit_ols(df):
+    from scipy import stats
 
-# Create synthetic data for statistical analysis
-np.random.seed(42)
-n_obs = 50
-skill_score = np.random.uniform(20, 100, size=n_obs)  # Simulated overall technical skill score
-# Assume a linear relationship: Graduates = 50 + 3 * Skill_Score + noise
-graduates_synthetic = 50 + 3 * skill_score + np.random.normal(0, 15, size=n_obs)
-causal_data = pd.DataFrame({
-    "Skill_Score": skill_score,
-    "Graduates": graduates_synthetic
-})
-
-# Fit a linear regression model using statsmodels
-X = sm.add_constant(causal_data["Skill_Score"])
-model = sm.OLS(causal_data["Graduates"], X).fit()
-
-# Display regression summary (first few lines for brevity)
-st.subheader("Regression Analysis Summary")
-st.text(model.summary().as_text())
-
-# Plot scatter with regression line
-fig_reg = px.scatter(causal_data, x="Skill_Score", y="Graduates",
+    # Accumulate in float64 even though the stored columns are float32
+    x = df["Skill_Score"].to_numpy(dtype=np.float64)
+    y = df["Graduates"].to_numpy(dtype=np.float64)
+    n = len(x)
+    x_mean, y_mean = x.mean(), y.mean()
+    sxx = ((x - x_mean) ** 2).sum()
+    beta = ((x - x_mean) * (y - y_mean)).sum() / sxx
+    alpha = y_mean - beta * x_mean
+    residuals = y - (alpha + beta * x)
+    sse = (residuals ** 2).sum()
+    sigma2 = sse / (n - 2)
+    se_beta = np.sqrt(sigma2 / sxx)
+    se_alpha = np.sqrt(sigma2 * (1 / n + x_mean ** 2 / sxx))
+    t_beta = beta / se_beta
+    t_alpha = alpha / se_alpha
+    return {
+        "n_obs": n,
+        "intercept": alpha,
+        "slope": beta,
+        "se_intercept": se_alpha,
+        "se_slope": se_beta,
+        "t_intercept": t_alpha,
+        "t_slope": t_beta,
+        "p_intercept": 2 * stats.t.sf(abs(t_alpha), df=n - 2),
+        "p_slope": 2 * stats.t.sf(abs(t_beta), df=n - 2),
+        "r_squared": 1 - sse / ((y - y_mean) ** 2).sum(),
+    }
+
+def format_ols_summary(model):
+    return f"""Dep. Variable: Graduates        No. Observations: {model['n_obs']}
+R-squared: {model['r_squared']:.3f}           Df Residuals: {model['n_obs'] - 2}
+
+                 coef    std err          t      P>|t|
+const      {model['intercept']:10.4f} {model['se_intercept']:10.3f} {model['t_intercept']:10.3f} {model['p_intercept']:10.3f}
+Skill_Score{model['slope']:10.4f} {model['se_slope']:10.3f} {model['t_slope']:10.3f} {model['p_slope']:10.3f}"""
+
+# Regression figure: scatter of the data with the fitted line overlaid
+@st.cache_resource(hash_funcs=df_hash_funcs)
+def make_reg_fig(df, intercept, slope):
+    import plotly.express as px
+
+    # Render through WebGL rather than SVG so the plot stays responsive as n_obs grows
+    fig = px.scatter(df, x="Skill_Score", y="Graduates",
                      title="Regression: Skill Score vs. Graduate Recruitment",
-                     labels={"Skill_Score": "Overall Technical Skill Score", "Graduates": "Number of Graduates"})
-# Add regression line
-reg_line = model.params["const"] + model.params["Skill_Score"] * causal_data["Skill_Score"]
-fig_reg.add_traces(px.line(x=causal_data["Skill_Score"], y=reg_line, labels={"y": "Fitted Graduates"}).data)
-st.plotly_chart(fig_reg, use_container_width=True)
+                     labels={"Skill_Score": "Overall Technical Skill Score", "Graduates": "Number of Graduates"},
+                     render_mode="webgl")
+    # Add regression line over sorted x values so it is drawn left to right
+    xs = np.sort(df["Skill_Score"].to_numpy())
+    reg_line = intercept + slope * xs
+    fig.add_scattergl(x=xs, y=reg_line, mode="lines", name="Fitted Graduates")
+    fig.update_layout(**fig_layout)
+    return fig
+
+@st.fragment
+def section_regression(causal_data, model):
+    st.header("5. Statistical Analysis: Linking Technical Skill Proficiency to Graduate Recruitment")
+
+    st.markdown("""
+    We simulate a synthetic scenario where an overall **Technical Skill Score** (aggregating high-demand skills)
+    may influence the number of graduates recruited. In this synthetic dataset, we assume:
+    - Higher technical skill scores are associated with increased recruitment.
+    - We model the relationship using a linear regression.
+    """)
+
+    # Display regression summary
+    st.subheader("Regression Analysis Summary")
+    st.text(format_ols_summary(model))
+
+    # Plot scatter with regression line
+    fig_reg = make_reg_fig(causal_data, model["intercept"], model["slope"])
+    st.plotly_chart(fig_reg, theme=None, use_container_width=False)
 
 # -------------------------------
 # Data-Driven Recommendations
 # -------------------------------
-st.header("6. Data-Driven Recommendations")
-st.markdown("""
+# The formatted text is cached alongside the regression results it depends on
+@st.cache_data
+def recommendations_md(coef, pval):
+    return f"""
 Based on the regression analysis:
 - **Coefficient Interpretation**: The estimated coefficient for **Skill Score** is approximately **{coef:.2f}** (p-value: {pval:.3f}). 
   This suggests that for each additional point in the skill score, the number of recruited graduates increases by about **{coef:.2f}** on average.
@@ -151,7 +303,19 @@ Based on the regression analysis:
 2. **Targeted Training Programs**: Implement workshops and certifications in key areas identified by the regression analysis.
 3. **Industry Partnerships**: Foster closer ties with companies that value these skills to provide real-world projects and internship opportunities.
 4. **Ongoing Evaluation**: Regularly analyze graduate outcomes with updated data to continuously refine training programs and maintain industry relevance.
-""".format(coef=model.params["Skill_Score"], pval=model.pvalues["Skill_Score"]))
+"""
+
+@st.fragment
+def section_recommendations(model):
+    st.header("6. Data-Driven Recommendations")
+    st.markdown(recommendations_md(model["slope"], model["p_slope"]))
+
+# Sections 5 and 6 are optional; scipy is only imported once they are shown
+if st.sidebar.checkbox("Include statistical analysis", True):
+    causal_data = build_causal_df()
+    model = fit_ols(causal_data)
+    section_regression(causal_data, model)
+    section_recommendations(model)
 
 # Footer / Data Source
 st.markdown("""